@@ -15,9 +15,8 @@ rm -f "$DB_FILE"
 
 # Step 2: Find all JSON files and populate the database
 echo "Populating the database with JSON files..."
-find "$JSON_DIRECTORY" -name "*.json" | while read json_file; do
-  node "$POPULATE_SCRIPT" "$json_file"
-done
+# Pass the files to a single node process so the database is opened once
+find "$JSON_DIRECTORY" -name "*.json" -exec node "$POPULATE_SCRIPT" {} +
 
 echo "Database population complete."
 mv languageLearningDatabase.db "$DB_FILE" 
\ No newline at end of file
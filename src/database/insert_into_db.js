@@ -10,63 +10,78 @@ function readJsonFile(filePath) {
         reject(err);
         return;
       }
-      resolve(JSON.parse(data));
+      // Parse here so a malformed file rejects instead of throwing out of the callback
+      try {
+        resolve(JSON.parse(data));
+      } catch (parseErr) {
+        reject(parseErr);
+      }
     });
   });
 }
 
-// Function to insert exercise into the database
+// Function to insert exercises into the database
 async function insertExercisesFromFile(filePath, db) {
   try {
     const exercises = await readJsonFile(filePath);
-    exercises.forEach((exercise) => {
-      // Extracting topic, type, and difficulty from file path
-      const filePathParts = filePath.split('/');
-      const language = filePathParts[3]; // Assuming 'french' is the fourth element in the path
-      const level = filePathParts[4]; // Assuming 'advanced' is the fifth element in the path
-      
-      // Extracting the topic from the file name
-      const fileName = filePathParts[filePathParts.length - 1]; // Get the last part of the path
-      const topic = fileName
-        .replace('prompt_', '') // Remove 'prompt_'
-        .split('_run')[0] // Split at '_run' and take the first part
-        .replace(/_/g, ' '); // Replace all underscores with spaces
-      db.addExercise(
-        topic,
-        'Translation', // Assuming the type is 'Translation'
-        level,
-        "French", // Assuming the first language is 'French'
-        "English", // Assuming the second language is 'English
-        exercise.French,
-        exercise.English,
-        (err, lastID) => {
-          if (err) {
-            console.error('Error inserting exercise:', err.message);
-          } else {
-            console.log(`Exercise inserted with ID: ${lastID}`);
-          }
+
+    // Extracting topic, type, and difficulty from file path
+    const filePathParts = filePath.split('/');
+    const language = filePathParts[3]; // Assuming 'french' is the fourth element in the path
+    const level = filePathParts[4]; // Assuming 'advanced' is the fifth element in the path
+
+    // Extracting the topic from the file name
+    const fileName = filePathParts[filePathParts.length - 1]; // Get the last part of the path
+    const topic = fileName
+      .replace('prompt_', '') // Remove 'prompt_'
+      .split('_run')[0] // Split at '_run' and take the first part
+      .replace(/_/g, ' '); // Replace all underscores with spaces
+
+    const rows = exercises.map((exercise) => ({
+      topic,
+      type: 'Translation', // Assuming the type is 'Translation'
+      difficultyLevel: level,
+      language1: "French", // Assuming the first language is 'French'
+      language2: "English", // Assuming the second language is 'English
+      language1Content: exercise.French,
+      language2Content: exercise.English,
+    }));
+
+    // Insert the whole file in a single transaction
+    await new Promise((resolve) => {
+      db.addExercises(rows, (err, count) => {
+        if (err) {
+          console.error('Error inserting exercises:', err.message);
+        } else {
+          console.log(`Inserted ${count} exercises from ${filePath}`);
         }
-      );
+        resolve();
+      });
     });
   } catch (err) {
     console.error('Error processing file:', err.message);
   }
 }
 
-// Main function that accepts the file path as an argument
-async function main(filePath) {
+// Main function that accepts one or more file paths as arguments
+async function main(filePaths) {
   const dbPath = './languageLearningDatabase.db'; // Adjust this path if necessary
   const db = new LanguageDB(dbPath);
 
-  await insertExercisesFromFile(filePath, db);
-
-  db.close(); // Close the database connection
+  try {
+    // Reuse one connection for every file instead of reopening per file
+    for (const filePath of filePaths) {
+      await insertExercisesFromFile(filePath, db);
+    }
+  } finally {
+    db.close(); // Close the database connection
+  }
 }
 
-const filePath = process.argv[2]; // Get file path from command line argument
-if (!filePath) {
+const filePaths = process.argv.slice(2); // Get file paths from command line arguments
+if (filePaths.length === 0) {
   console.error('No file path provided.');
   process.exit(1);
 }
 
-main(filePath);
+main(filePaths);
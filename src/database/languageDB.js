@@ -1,8 +1,24 @@
 const sqlite3 = require("sqlite3").verbose();
 const path = require("path");
 
+// Resolved relative to this module so lookups don't depend on the process cwd
+const DEFAULT_DB_PATH = path.join(__dirname, "languageLearningDatabase.db");
+
+// Query text kept together here so the SQL is easy to find and review
+const INSERT_EXERCISE_SQL =
+  "INSERT INTO exercises (topic, type, difficulty_level, language_1, language_2, language_1_content, language_2_content) VALUES (?, ?, ?, ?, ?, ?, ?)";
+const SELECT_DIFFICULTY_LEVELS_SQL =
+  "SELECT DISTINCT difficulty_level FROM exercises";
+const SELECT_TOPICS_BY_DIFFICULTY_SQL =
+  "SELECT DISTINCT topic FROM exercises WHERE difficulty_level = ?";
+const SELECT_LANGUAGES_BY_TOPIC_AND_DIFFICULTY_SQL =
+  "SELECT DISTINCT language_1, language_2 FROM exercises WHERE topic = ? AND difficulty_level = ?";
+const SELECT_TOPICS_BY_LANGUAGE_SQL =
+  "SELECT DISTINCT topic FROM exercises WHERE language_1 = ? OR language_2 = ?";
+
 class LanguageDB {
-  constructor(dbPath = "./src/database/languageLearningDatabase.db") {
+  constructor(dbPath = DEFAULT_DB_PATH, { isDev = false } = {}) {
+    this.isDev = isDev;
     this.db = new sqlite3.Database(
       dbPath,
       sqlite3.OPEN_READWRITE | sqlite3.OPEN_CREATE,
@@ -18,6 +34,21 @@ class LanguageDB {
 
   _initialize() {
     this.db.serialize(() => {
+      // Connection is shared for the app's lifetime, so tune it once up front.
+      // These only last for the connection; journal_mode is left at the default
+      // because WAL is persisted into the file and dbReset.sh moves only the .db
+      const pragmas = [
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -64000",
+      ];
+      pragmas.forEach((pragma) => {
+        this.db.run(pragma, (err) => {
+          if (err) {
+            console.error("Error applying pragma:", err.message);
+          }
+        });
+      });
+
       const tableCreationQueries = [
         `CREATE TABLE IF NOT EXISTS users (
           id INTEGER PRIMARY KEY,
@@ -45,6 +76,12 @@ class LanguageDB {
         )`,
       ];
 
+      // Covering index for the difficulty -> topic lookups in the Reading flow
+      const indexCreationQueries = [
+        `CREATE INDEX IF NOT EXISTS idx_exercises_difficulty_topic
+          ON exercises (difficulty_level, topic)`,
+      ];
+
       // Create tables
       tableCreationQueries.forEach((query) => {
         this.db.run(query, (err) => {
@@ -54,6 +91,15 @@ class LanguageDB {
         });
       });
 
+      // Create indexes
+      indexCreationQueries.forEach((query) => {
+        this.db.run(query, (err) => {
+          if (err) {
+            console.error("Error creating index:", err.message);
+          }
+        });
+      });
+
       // Create default user
       this.db.run(
         "INSERT OR IGNORE INTO users (id, name) VALUES (?, ?)",
@@ -64,24 +110,27 @@ class LanguageDB {
           }
         }
       );
-      this._printExercisesCount();
+      if (this.isDev) {
+        this._probeExercises();
+      }
 
     });
   }
 
-  _printExercisesCount() {
-    this.db.get("SELECT COUNT(*) AS count FROM exercises", [], (err, row) => {
+  _probeExercises() {
+    // Only touch a single row; a full COUNT(*) scans the whole table on every launch
+    this.db.get("SELECT 1 FROM exercises LIMIT 1", [], (err, row) => {
       if (err) {
-        console.error("Error fetching exercise count:", err.message);
+        console.error("Error probing exercises table:", err.message);
       } else {
-        console.log(`Number of entries in 'exercises' table: ${row.count}`);
+        console.log(`'exercises' table populated: ${Boolean(row)}`);
       }
     });
   }
 
   addExercise(topic, type, difficultyLevel, language1, language2, language1Content, language2Content, callback) {
     this.db.run(
-      "INSERT INTO exercises (topic, type, difficulty_level, language_1, language_2, language_1_content, language_2_content) VALUES (?, ?, ?, ?, ?, ?, ?)",
+      INSERT_EXERCISE_SQL,
       [topic, type, difficultyLevel, language1, language2, language1Content, language2Content],
       function (err) {
         if (typeof callback === "function") {
@@ -91,13 +140,87 @@ class LanguageDB {
     );
   }
   
+  addExercises(exercises, callback) {
+    // One transaction and prepared statement for the whole batch, rather than
+    // an implicit commit per inserted row. If anything fails the batch is
+    // rolled back, so the callback reports either every row or none.
+    let firstError = null;
+    let began = false;
+    let inserted = 0;
+    const recordError = (err) => {
+      if (err && !firstError) {
+        firstError = err;
+      }
+    };
+    const done = (err, count) => {
+      if (typeof callback === "function") {
+        callback(err, count);
+      }
+    };
+    const rollback = () => {
+      this.db.run("ROLLBACK", (err) => {
+        if (err) {
+          console.error("Error rolling back exercises:", err.message);
+        }
+        done(firstError, 0);
+      });
+    };
+
+    this.db.serialize(() => {
+      this.db.run("BEGIN TRANSACTION", (err) => {
+        recordError(err);
+        began = !err;
+      });
+      const statement = this.db.prepare(INSERT_EXERCISE_SQL, recordError);
+      exercises.forEach((exercise) => {
+        statement.run(
+          [
+            exercise.topic,
+            exercise.type,
+            exercise.difficultyLevel,
+            exercise.language1,
+            exercise.language2,
+            exercise.language1Content,
+            exercise.language2Content,
+          ],
+          (err) => {
+            recordError(err);
+            if (!err) {
+              inserted += 1;
+            }
+          }
+        );
+      });
+      // Every row's callback has run by the time finalize reports back, so
+      // this is where the batch is either committed or rolled back
+      statement.finalize((err) => {
+        recordError(err);
+        if (!began) {
+          // Nothing of ours to roll back if the transaction never started
+          done(firstError, 0);
+        } else if (firstError) {
+          rollback();
+        } else {
+          this.db.run("COMMIT", (commitErr) => {
+            if (commitErr) {
+              recordError(commitErr);
+              rollback();
+              return;
+            }
+            done(null, inserted);
+          });
+        }
+      });
+    });
+  }
+
   getDifficultyLevels(callback) {
-    this.db.all("SELECT DISTINCT difficulty_level FROM exercises", [], callback);
+    this.db.all(SELECT_DIFFICULTY_LEVELS_SQL, [], callback);
   }
 
   getTopicsByDifficulty(difficultyLevel, callback) {
     this.db.all(
-      "SELECT DISTINCT topic FROM exercises WHERE difficulty_level = ?",
+      SELECT_TOPICS_BY_DIFFICULTY_SQL,
       [difficultyLevel],
       callback
     );
@@ -105,17 +228,14 @@ class LanguageDB {
 
   getLanguagesByTopicAndDifficulty(topic, difficultyLevel, callback) {
     this.db.all(
-      "SELECT DISTINCT language_1, language_2 FROM exercises WHERE (language_1 = ? OR language_2 = ?) AND topic = ? AND difficulty_level = ?",
+      SELECT_LANGUAGES_BY_TOPIC_AND_DIFFICULTY_SQL,
       [topic, difficultyLevel],
       callback
     );
   }
 
   getTopicsByLanguage(languageName, callback) {
-    const query = `SELECT DISTINCT topic FROM exercises WHERE language_1 = ? OR language_2 = ?`;
-    console.log("Query:", query);
-    console.log("Language name:", languageName);
-    this.db.all(query, [languageName, languageName], callback);
+    this.db.all(SELECT_TOPICS_BY_LANGUAGE_SQL, [languageName, languageName], callback);
   }
   
   close() {
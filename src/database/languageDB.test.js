@@ -0,0 +1,84 @@
+/**
+ * @jest-environment node
+ */
+const fs = require("fs");
+const os = require("os");
+const path = require("path");
+const LanguageDB = require("./languageDB");
+
+const exercise = (overrides = {}) => ({
+  topic: "Food and Dining",
+  type: "Translation",
+  difficultyLevel: "beginner",
+  language1: "French",
+  language2: "English",
+  language1Content: "Bonjour",
+  language2Content: "Hello",
+  ...overrides,
+});
+
+const get = (db, sql) =>
+  new Promise((resolve, reject) => {
+    db.db.get(sql, [], (err, row) => (err ? reject(err) : resolve(row)));
+  });
+
+const addExercises = (db, exercises) =>
+  new Promise((resolve) => {
+    db.addExercises(exercises, (err, count) => resolve({ err, count }));
+  });
+
+// The schema is created asynchronously once the connection opens
+const waitForSchema = async (db) => {
+  for (let attempt = 0; attempt < 100; attempt++) {
+    const row = await get(
+      db,
+      "SELECT name FROM sqlite_master WHERE name = 'idx_exercises_difficulty_topic'"
+    );
+    if (row) {
+      return;
+    }
+    await new Promise((resolve) => setTimeout(resolve, 10));
+  }
+  throw new Error("Schema was not created");
+};
+
+let tmpDir;
+let db;
+
+beforeEach(async () => {
+  tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "ahlingo-db-"));
+  db = new LanguageDB(path.join(tmpDir, "test.db"));
+  await waitForSchema(db);
+});
+
+afterEach(async () => {
+  await new Promise((resolve) => db.db.close(resolve));
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+});
+
+test("addExercises inserts the whole batch", async () => {
+  const { err, count } = await addExercises(db, [
+    exercise(),
+    exercise({ topic: "Travel and Transportation" }),
+    exercise({ difficultyLevel: "advanced" }),
+  ]);
+
+  expect(err).toBeNull();
+  expect(count).toBe(3);
+  expect((await get(db, "SELECT COUNT(*) AS n FROM exercises")).n).toBe(3);
+});
+
+test("addExercises rolls back the batch when a row fails", async () => {
+  await addExercises(db, [exercise()]);
+
+  // A missing French entry binds NULL into a NOT NULL column
+  const { err, count } = await addExercises(db, [
+    exercise(),
+    exercise({ language1Content: undefined }),
+    exercise(),
+  ]);
+
+  expect(err).toBeTruthy();
+  expect(count).toBe(0);
+  expect((await get(db, "SELECT COUNT(*) AS n FROM exercises")).n).toBe(1);
+});
@@ -4,9 +4,6 @@ import "./index.css";
 import App from "./renderer/App";
 import reportWebVitals from "./reportWebVitals";
 
-console.log("index.js");
-
-
 const root = ReactDOM.createRoot(document.getElementById("root"));
 root.render(
   <React.StrictMode>
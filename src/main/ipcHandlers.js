@@ -1,8 +1,8 @@
 const { ipcMain } = require("electron");
 const LanguageDB = require('../database/languageDB');
 
-function setupIPC() {
-  const db = new LanguageDB();
+function setupIPC({ isDev = false } = {}) {
+  const db = new LanguageDB(undefined, { isDev });
   ipcMain.on("add-user", (event, arg) => {
     const userName = arg.name;
     db.addUser(userName, (err) => {
@@ -35,7 +35,7 @@ function setupIPC() {
         event.reply('get-topics-reply', { error: err.message });
         return;
       }
-      event.reply('get-topics-reply', { topics });
+      event.reply('get-topics-reply', { topics, difficultyLevel });
     });
   });
 
@@ -58,12 +58,11 @@ ipcMain.on('get-topics', (event, languageName) => {
       event.reply('get-topics-reply', { error: err.message });
       return;
     }
-    console.log("Sending topics:", topics);
     event.reply('get-topics-reply', { topics });
   });
 });
 
-
+  return db;
 }
 
 module.exports = setupIPC;
@@ -1,7 +1,12 @@
 const { app, BrowserWindow, ipcMain, session } = require("electron");
-const isDev = process.env.NODE_ENV !== "production";
+// Nothing sets NODE_ENV for the main process, so use the packaging state instead
+const isDev = !app.isPackaged;
 const path = require("path");
-const setupIPC = require("./ipcHandlers"); // Import the setup function for IPC
+
+// main.js lives in src/main; bundled assets and build output are at the app root
+const appRoot = path.join(__dirname, "..", "..");
+
+let db; // Shared LanguageDB connection, opened once by setupIPC
 
 function createWindow() {
   const win = new BrowserWindow({
@@ -12,14 +17,14 @@ function createWindow() {
       contextIsolation: false,
       enableRemoteModule: true,
     },  
-    icon: path.join(__dirname, "assets/logo.icns"),
+    icon: path.join(appRoot, "assets", "logo.png"),
   });
-  win.webContents.openDevTools();
 
   if (isDev) {
+    win.webContents.openDevTools();
     win.loadURL("http://localhost:8080");
   } else {
-    win.loadFile(path.join(__dirname, "dist", "index.html"));
+    win.loadFile(path.join(appRoot, "dist", "index.html"));
   }
 }
 
@@ -28,7 +33,10 @@ app.on("ready", () => {
   console.log("App is ready");
   createWindow();
   console.log("Window created");
-  setupIPC(); // Set up the IPC event handlers if needed
+  // Required here rather than at the top so the sqlite3 native binding loads
+  // while the renderer is already starting up
+  const setupIPC = require("./ipcHandlers");
+  db = setupIPC({ isDev }); // Set up the IPC event handlers if needed
   console.log("IPC handlers set up");
   
   // Set up the webRequest to modify headers if necessary
@@ -44,5 +52,5 @@ app.on("ready", () => {
 });
 
 app.on("will-quit", () => {
-  db.close(); // Close the database connection when the app is about to quit
+  if (db) db.close(); // Close the database connection when the app is about to quit
 });
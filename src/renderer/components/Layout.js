@@ -1,14 +1,32 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, lazy, Suspense } from "react";
 import { useLocation, Route, Routes } from "react-router-dom";
 
 import MainAppBar from "./MainAppBar";
 import Menu from "./Menu";
-import Reading from "./Reading";
-import Writing from "./Writing";
-import Scenarios from "./Scenarios";
-import Chatbot from "./Chatbot";
-import Settings from "./Settings";
-import UserInfo from "./UserInfo";
+
+const pageLoaders = {
+  reading: () => import("./Reading"),
+  writing: () => import("./Writing"),
+  scenarios: () => import("./Scenarios"),
+  chatbot: () => import("./Chatbot"),
+  settings: () => import("./Settings"),
+  userInfo: () => import("./UserInfo"),
+};
+
+// Subpages are only loaded and mounted the first time they are navigated to
+const Reading = lazy(pageLoaders.reading);
+const Writing = lazy(pageLoaders.writing);
+const Scenarios = lazy(pageLoaders.scenarios);
+const Chatbot = lazy(pageLoaders.chatbot);
+const Settings = lazy(pageLoaders.settings);
+const UserInfo = lazy(pageLoaders.userInfo);
+
+// Fetch the remaining page chunks once the menu has painted and the renderer
+// is idle, so the first navigation doesn't wait on a module load
+function prewarmPages() {
+  // Load failures are ignored here; React.lazy reports them on navigation
+  Object.values(pageLoaders).forEach((load) => load().catch(() => {}));
+}
 
 function Layout() {
   const [showMenu, setShowMenu] = useState(true);
@@ -18,19 +36,31 @@ function Layout() {
     setShowMenu(location.pathname === "/");
   }, [location]);
 
+  useEffect(() => {
+    // requestIdleCallback isn't available everywhere (e.g. jsdom in tests)
+    if (typeof window.requestIdleCallback !== "function") {
+      const timer = setTimeout(prewarmPages, 2000);
+      return () => clearTimeout(timer);
+    }
+    const handle = window.requestIdleCallback(prewarmPages, { timeout: 2000 });
+    return () => window.cancelIdleCallback(handle);
+  }, []);
+
   return (
     <>
       <MainAppBar />
       <Menu showMenu={showMenu} setShowMenu={setShowMenu} />
-      <Routes>
-        <Route path="/" element={<div>Welcome! Select a menu option.</div>} />
-        <Route path="/reading" element={<Reading />} />
-        <Route path="/writing" element={<Writing />} />
-        <Route path="/scenarios" element={<Scenarios />} />
-        <Route path="/chatbot" element={<Chatbot />} />
-        <Route path="/settings" element={<Settings />} />
-        <Route path="/user-info" element={<UserInfo />} />
-      </Routes>
+      <Suspense fallback={null}>
+        <Routes>
+          <Route path="/" element={<div>Welcome! Select a menu option.</div>} />
+          <Route path="/reading" element={<Reading />} />
+          <Route path="/writing" element={<Writing />} />
+          <Route path="/scenarios" element={<Scenarios />} />
+          <Route path="/chatbot" element={<Chatbot />} />
+          <Route path="/settings" element={<Settings />} />
+          <Route path="/user-info" element={<UserInfo />} />
+        </Routes>
+      </Suspense>
     </>
   );
 }
@@ -1,4 +1,4 @@
-import React, { useState } from "react";
+import React, { useState, useCallback } from "react";
 import { useLocation, useNavigate } from "react-router-dom";
 import {
   AppBar,
@@ -15,30 +15,35 @@ import MenuIcon from "@mui/icons-material/Menu";
 import AccountCircleIcon from "@mui/icons-material/AccountCircle";
 import SettingsIcon from "@mui/icons-material/Settings";
 
+const titleStyle = { flexGrow: 1 };
+
 function MainAppBar() {
   const location = useLocation();
   const navigate = useNavigate();
   const [drawerOpen, setDrawerOpen] = useState(false);
 
-  const toggleDrawer = (open) => (event) => {
+  // Stable handlers so the button and drawer props don't change every render
+  const openDrawer = useCallback(() => setDrawerOpen(true), []);
+
+  const closeDrawer = useCallback((event) => {
     if (
       event.type === "keydown" &&
       (event.key === "Tab" || event.key === "Shift")
     ) {
       return;
     }
-    setDrawerOpen(open);
-  };
+    setDrawerOpen(false);
+  }, []);
 
-  const navigateToUserInfo = () => {
+  const navigateToUserInfo = useCallback(() => {
     setDrawerOpen(false);
     navigate("/user-info");
-  };
+  }, [navigate]);
 
-  const navigateToSettings = () => {
+  const navigateToSettings = useCallback(() => {
     setDrawerOpen(false);
     navigate("/settings");
-  };
+  }, [navigate]);
 
   // Only display the AppBar on the home page
   if (location.pathname !== "/") {
@@ -53,16 +58,16 @@ function MainAppBar() {
             edge="start"
             color="inherit"
             aria-label="menu"
-            onClick={toggleDrawer(true)}
+            onClick={openDrawer}
           >
             <MenuIcon />
           </IconButton>
-          <Typography variant="h6" style={{ flexGrow: 1 }}>
+          <Typography variant="h6" style={titleStyle}>
             MyApp
           </Typography>
         </Toolbar>
       </AppBar>
-      <Drawer anchor="left" open={drawerOpen} onClose={toggleDrawer(false)}>
+      <Drawer anchor="left" open={drawerOpen} onClose={closeDrawer}>
         <List>
           <ListItem button onClick={navigateToUserInfo}>
             <ListItemIcon>
@@ -1,21 +1,17 @@
-import React, { useEffect } from "react";
-import { useNavigate, useLocation } from "react-router-dom";
+import React from "react";
+import { useNavigate } from "react-router-dom";
 import { Box, Grid, Paper, IconButton } from "@mui/material";
 import ReadIcon from "@mui/icons-material/Book";
 import WriteIcon from "@mui/icons-material/Create";
 import ScenarioIcon from "@mui/icons-material/Explore";
 import ChatIcon from "@mui/icons-material/Chat";
 
+// Two fixed sx objects so toggling the menu doesn't build a new one per render
+const visibleSx = { flexGrow: 1, display: "flex" };
+const hiddenSx = { flexGrow: 1, display: "none" };
+
 function Menu({ showMenu, setShowMenu }) {
   const navigate = useNavigate();
-  const location = useLocation();
-
-  useEffect(() => {
-    // Show the menu when the user navigates back to the main page
-    if (location.pathname === "/") {
-      setShowMenu(true);
-    }
-  }, [location, setShowMenu]);
 
   const handleNavigation = (path) => {
     setShowMenu(false);
@@ -23,7 +19,7 @@ function Menu({ showMenu, setShowMenu }) {
   };
 
   return (
-    <Box sx={{ flexGrow: 1, display: showMenu ? "flex" : "none" }}>
+    <Box sx={showMenu ? visibleSx : hiddenSx}>
       <Grid container spacing={2}>
         <Grid item xs={6}>
           <Paper elevation={3} onClick={() => handleNavigation("/reading")}>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import SubpageTemplate from "./SubpageTemplate";
 import Button from "@mui/material/Button";
 const { ipcRenderer } = window.require('electron');
@@ -9,10 +9,14 @@ function Reading({ onBack }) {
   const [topics, setTopics] = useState([]);
   const [selectedTopic, setSelectedTopic] = useState('');
   const [languages, setLanguages] = useState([]);
+  // Topics per difficulty level, so revisiting a level doesn't re-query
+  const topicsCache = useRef(new Map());
+  // Level the topic list is currently showing; stale replies only fill the cache
+  const topicsLevel = useRef('');
 
   useEffect(() => {
-    ipcRenderer.send('get-difficulty-levels');
-
+    // Reply listeners are registered once for the component's lifetime and
+    // removed on unmount, so late replies can't reach an unmounted page
     ipcRenderer.on('get-difficulty-levels-reply', (event, { error, levels }) => {
       if (error) {
         console.error("Error fetching difficulty levels:", error);
@@ -21,6 +25,27 @@ function Reading({ onBack }) {
       setDifficultyLevels(levels);
     });
 
+    ipcRenderer.on('get-topics-reply', (event, { error, topics, difficultyLevel }) => {
+      if (error) {
+        console.error("Error fetching topics:", error);
+        return;
+      }
+      topicsCache.current.set(difficultyLevel, topics);
+      if (difficultyLevel === topicsLevel.current) {
+        setTopics(topics);
+      }
+    });
+
+    ipcRenderer.on('get-languages-reply', (event, { error, languages }) => {
+      if (error) {
+        console.error("Error fetching languages:", error);
+        return;
+      }
+      setLanguages(languages);
+    });
+
+    ipcRenderer.send('get-difficulty-levels');
+
     // Cleanup
     return () => {
       ipcRenderer.removeAllListeners('get-difficulty-levels-reply');
@@ -31,28 +56,19 @@ function Reading({ onBack }) {
 
   const handleDifficultyClick = (level) => {
     setSelectedDifficulty(level);
-    ipcRenderer.send('get-topics', level);
-    // Listener for topics
-    ipcRenderer.on('get-topics-reply', (event, { error, topics }) => {
-      if (error) {
-        console.error("Error fetching topics:", error);
-        return;
-      }
-      setTopics(topics);
-    });
+    topicsLevel.current = level;
+    const cachedTopics = topicsCache.current.get(level);
+    if (cachedTopics) {
+      setTopics(cachedTopics);
+      return;
+    }
+    setTopics([]);
+    ipcRenderer.send('get-topics-by-difficulty', level);
   };
 
   const handleTopicClick = (topic) => {
     setSelectedTopic(topic);
-    ipcRenderer.send('get-languages', { difficulty: selectedDifficulty, topic });
-    // Listener for languages
-    ipcRenderer.on('get-languages-reply', (event, { error, languages }) => {
-      if (error) {
-        console.error("Error fetching languages:", error);
-        return;
-      }
-      setLanguages(languages);
-    });
+    ipcRenderer.send('get-languages', { difficultyLevel: selectedDifficulty, topic });
   };
 
   return (
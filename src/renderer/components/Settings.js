@@ -13,6 +13,9 @@ import {
 } from "@mui/material";
 import ArrowBackIcon from "@mui/icons-material/ArrowBack";
 
+const titleStyle = { marginLeft: 20 };
+const containerStyle = { marginTop: 20 };
+
 function Settings() {
   const navigate = useNavigate();
 
@@ -28,12 +31,12 @@ function Settings() {
           >
             <ArrowBackIcon />
           </IconButton>
-          <Typography variant="h6" style={{ marginLeft: 20 }}>
+          <Typography variant="h6" style={titleStyle}>
             Settings
           </Typography>
         </Toolbar>
       </AppBar>
-      <Container style={{ marginTop: 20 }}>
+      <Container style={containerStyle}>
         <Typography variant="h4" gutterBottom>
           Settings
         </Typography>
@@ -9,6 +9,10 @@ import {
 } from "@mui/material";
 import ArrowBackIcon from "@mui/icons-material/ArrowBack";
 
+// Shared across renders so each subpage doesn't allocate fresh style objects
+const titleStyle = { marginLeft: 20 };
+const containerStyle = { marginTop: 20 };
+
 function SubpageTemplate({ title, children }) {
   const navigate = useNavigate();
 
@@ -28,12 +32,12 @@ function SubpageTemplate({ title, children }) {
           >
             <ArrowBackIcon />
           </IconButton>
-          <Typography variant="h6" style={{ marginLeft: 20 }}>
+          <Typography variant="h6" style={titleStyle}>
             {title}
           </Typography>
         </Toolbar>
       </AppBar>
-      <Container style={{ marginTop: 20 }}>{children}</Container>
+      <Container style={containerStyle}>{children}</Container>
     </>
   );
 }
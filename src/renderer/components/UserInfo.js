@@ -13,6 +13,10 @@ import {
 } from "@mui/material";
 import ArrowBackIcon from "@mui/icons-material/ArrowBack";
 
+const titleStyle = { marginLeft: 20 };
+const containerStyle = { marginTop: 20 };
+const paperStyle = { padding: 16 };
+
 function UserInfo() {
   const navigate = useNavigate();
 
@@ -28,13 +32,13 @@ function UserInfo() {
           >
             <ArrowBackIcon />
           </IconButton>
-          <Typography variant="h6" style={{ marginLeft: 20 }}>
+          <Typography variant="h6" style={titleStyle}>
             User Information
           </Typography>
         </Toolbar>
       </AppBar>
-      <Container style={{ marginTop: 20 }}>
-        <Paper elevation={3} style={{ padding: 16 }}>
+      <Container style={containerStyle}>
+        <Paper elevation={3} style={paperStyle}>
           <List>
             <ListItem>
               <ListItemText primary="Name" secondary="Aoife H" />
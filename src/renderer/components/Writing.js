@@ -1,7 +1,7 @@
 import React from "react";
 import SubpageTemplate from "./SubpageTemplate";
 
-function Chatbot({ onBack }) {
+function Writing({ onBack }) {
   return (
     <SubpageTemplate title="Writing" onBack={onBack}>
       <div>Writing Page Content</div>
@@ -9,4 +9,4 @@ function Chatbot({ onBack }) {
   );
 }
 
-export default Chatbot;
+export default Writing;